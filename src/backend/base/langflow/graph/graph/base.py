@@ -79,6 +79,9 @@ class Graph:
         self.stop_vertex: Optional[str] = None
 
         self.inactive_vertices: set = set()
+        # bumped every time the adjacency maps are rebuilt so per-vertex
+        # edge caches can detect topology changes
+        self._edges_epoch = 0
         self.edges: List[ContractEdge] = []
         self.vertices: List[Vertex] = []
         self.run_manager = RunnableVerticesManager()
@@ -514,6 +517,7 @@ class Graph:
         if vertices is None:
             vertices = self.vertices
 
+        self._edges_epoch += 1
         self.predecessor_map, self.successor_map = self.build_adjacency_maps(edges)
 
         self.in_degree_map = self.build_in_degree(edges)
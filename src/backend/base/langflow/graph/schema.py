@@ -65,8 +65,8 @@ class InterfaceComponentTypes(str, Enum, metaclass=ContainsEnumMeta):
             return True
 
 
-CHAT_COMPONENTS = [InterfaceComponentTypes.ChatInput, InterfaceComponentTypes.ChatOutput]
-RECORDS_COMPONENTS = [InterfaceComponentTypes.DataOutput]
+CHAT_COMPONENTS = frozenset({InterfaceComponentTypes.ChatInput, InterfaceComponentTypes.ChatOutput})
+RECORDS_COMPONENTS = frozenset({InterfaceComponentTypes.DataOutput})
 INPUT_COMPONENTS = [
     InterfaceComponentTypes.ChatInput,
     InterfaceComponentTypes.TextInput,
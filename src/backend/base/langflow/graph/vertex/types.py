@@ -1,7 +1,9 @@
-import json
-from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Generator, Iterator, List
+import math
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional
 
-import yaml
+import orjson
 from langchain_core.messages import AIMessage, AIMessageChunk
 from loguru import logger
 
@@ -20,6 +22,12 @@ from langflow.utils.util import unescape_string
 if TYPE_CHECKING:
     from langflow.graph.edge.base import ContractEdge
 
+@lru_cache(maxsize=1024)
+def _titlecase(key: str) -> str:
+    # artifact keys repeat heavily across reprs, but the DataOutput path
+    # feeds arbitrary Data keys through here, so the cache must be bounded
+    return key.title().replace("_", " ")
+
 
 class CustomComponentVertex(Vertex):
     def __init__(self, data: Dict, graph):
@@ -33,6 +41,10 @@ class CustomComponentVertex(Vertex):
 class ComponentVertex(Vertex):
     def __init__(self, data: Dict, graph):
         super().__init__(data, graph=graph, base_type="component")
+        # both caches are keyed on the graph's edge-topology epoch so that
+        # in-place graph updates invalidate them
+        self._edges_by_target: Optional[tuple] = None
+        self._source_handle_by_requester: tuple = (-1, {})
 
     def _built_object_repr(self):
         if self.artifacts and "repr" in self.artifacts:
@@ -53,8 +65,9 @@ class ComponentVertex(Vertex):
         else:
             self._built_object = result
 
-        for key, value in self._built_object.items():
-            self.add_result(key, value)
+        # add_result just assigns into self.results, so one C-level bulk
+        # update replaces the per-key Python calls
+        self.results.update(self._built_object)
 
     def get_edge_with_target(self, target_id: str) -> Generator["ContractEdge", None, None]:
         """
@@ -66,9 +79,17 @@ class ComponentVertex(Vertex):
         Returns:
             The edge with the target id.
         """
-        for edge in self.edges:
-            if edge.target_id == target_id:
-                yield edge
+        # self.edges is recomputed from the graph on every access, so build
+        # a target_id -> edges map once per topology epoch and reuse it
+        epoch = self.graph._edges_epoch
+        cache = self._edges_by_target
+        if cache is None or cache[0] != epoch:
+            edges_by_target: Dict[str, List["ContractEdge"]] = {}
+            for edge in self.edges:
+                edges_by_target.setdefault(edge.target_id, []).append(edge)
+            cache = (epoch, edges_by_target)
+            self._edges_by_target = cache
+        yield from cache[1].get(target_id, [])
 
     async def _get_result(self, requester: "Vertex") -> Any:
         """
@@ -86,12 +107,26 @@ class ComponentVertex(Vertex):
         if requester is None:
             raise ValueError("Requester Vertex is None")
 
+        # once an edge to a requester has been resolved, the source handle
+        # name is stable until the graph is rewired, so skip the edge scan
+        # on subsequent pulls within the same topology epoch
+        epoch = self.graph._edges_epoch
+        handle_cache = self._source_handle_by_requester
+        if handle_cache[0] != epoch:
+            handle_cache = (epoch, {})
+            self._source_handle_by_requester = handle_cache
+        handle_name = handle_cache[1].get(requester.id)
+        if handle_name is not None and handle_name in self.results:
+            log_transaction(source=self, target=requester, flow_id=self.graph.flow_id, status="success")
+            return self.results[handle_name]
+
         edges = self.get_edge_with_target(requester.id)
         result = UNDEFINED
         edge = None
         for edge in edges:
             if edge is not None and edge.source_handle.name in self.results:
                 result = self.results[edge.source_handle.name]
+                handle_cache[1][requester.id] = edge.source_handle.name
                 break
         if result is UNDEFINED:
             if edge is None:
@@ -129,9 +164,7 @@ class ComponentVertex(Vertex):
                         sender_name=message_dict.get("sender_name"),
                         session_id=message_dict.get("session_id"),
                         stream_url=message_dict.get("stream_url"),
-                        files=[
-                            {"path": file} if isinstance(file, str) else file for file in message_dict.get("files", [])
-                        ],
+                        files=_normalize_files(message_dict.get("files", [])),
                         component_id=self.id,
                         type=self.artifacts_type[key],
                     ).model_dump(exclude_none=True)
@@ -160,10 +193,29 @@ class InterfaceVertex(ComponentVertex):
     def __init__(self, data: Dict, graph):
         super().__init__(data, graph=graph)
         self.steps = [self._build, self._run]
+        self._artifacts_repr_cache: Optional[tuple] = None
+        self._nf_cache: Optional[tuple] = None
+        # vertex_type never changes after construction, so resolve the
+        # component-kind membership tests once instead of on every run
+        self._is_chat_component = self.vertex_type in CHAT_COMPONENTS
+        self._is_data_component = self.vertex_type in RECORDS_COMPONENTS
 
     def build_stream_url(self):
         return f"/api/v1/build/{self.graph.flow_id}/{self.id}/stream"
 
+    @property
+    def _normalized_files(self) -> List[Any]:
+        # a vertex that streams and then finalizes normalizes the same
+        # params["files"] twice; key the cache on the raw object's identity
+        # so the second access skips the normalization pass entirely
+        cached = self._nf_cache
+        raw = self.params.get("files", ())
+        if cached is not None and cached[0] is raw:
+            return cached[1]
+        normalized = _normalize_files(raw)
+        self._nf_cache = (raw, normalized)
+        return normalized
+
     def _built_object_repr(self):
         if self.task_id and self.is_task:
             if task := self.get_task():
@@ -171,7 +223,14 @@ class InterfaceVertex(ComponentVertex):
             else:
                 return f"Task {self.task_id} is not running"
         if self.artifacts:
-            # dump as a yaml string
+            # the rendered repr is requested repeatedly for the same
+            # artifacts (e.g. UI polling), so memoize it per artifacts
+            # object; the object is pinned in the entry so a recycled id()
+            # cannot alias a different artifacts dict
+            cache = self._artifacts_repr_cache
+            if cache is not None and cache[0] is self.artifacts:
+                return cache[1]
+            # dump as an indented JSON string
             if isinstance(self.artifacts, dict):
                 _artifacts = [self.artifacts]
             elif hasattr(self.artifacts, "data"):
@@ -180,11 +239,15 @@ class InterfaceVertex(ComponentVertex):
                 _artifacts = self.artifacts
             artifacts = []
             for artifact in _artifacts:
-                # artifacts = {k.title().replace("_", " "): v for k, v in self.artifacts.items() if v is not None}
-                artifact = {k.title().replace("_", " "): v for k, v in artifact.items() if v is not None}
+                artifact = {_titlecase(k): v for k, v in artifact.items() if v is not None}
                 artifacts.append(artifact)
-            yaml_str = yaml.dump(artifacts, default_flow_style=False, allow_unicode=True)
-            return yaml_str
+            repr_str = orjson.dumps(
+                artifacts,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                default=str,
+            ).decode()
+            self._artifacts_repr_cache = (self.artifacts, repr_str)
+            return repr_str
         return super()._built_object_repr()
 
     def _process_chat_component(self):
@@ -211,52 +274,68 @@ class InterfaceVertex(ComponentVertex):
         Returns:
             str: The processed message.
         """
-        artifacts = None
-        sender = self.params.get("sender", None)
-        sender_name = self.params.get("sender_name", None)
-        message = self.params.get(INPUT_FIELD_NAME, None)
-        files = [{"path": file} if isinstance(file, str) else file for file in self.params.get("files", [])]
-        if isinstance(message, str):
-            message = unescape_string(message)
-        stream_url = None
-        if "text" in self.results:
-            text_output = self.results["text"]
-        elif "message" in self.results:
-            text_output = self.results["message"].text
+        params = self.params
+        results = self.results
+        message = params.get(INPUT_FIELD_NAME, None)
+        if type(message) is str or isinstance(message, str):
+            if "\\" in message:
+                # the C-level scan rejects the common escape-free message
+                # without even calling unescape_string
+                message = unescape_string(message)
+        if "text" in results:
+            text_output = results["text"]
+        elif "message" in results:
+            text_output = results["message"].text
         else:
             text_output = message
-        if isinstance(text_output, (AIMessage, AIMessageChunk)):
+        # type() identity checks are much cheaper than isinstance for the
+        # concrete types that dominate this cascade; isinstance stays as a
+        # fallback so subclasses keep working.
+        text_type = type(text_output)
+        if text_type is UnbuiltObject or isinstance(text_output, UnbuiltObject):
+            # nothing was built: skip the params extraction and artifact
+            # construction entirely
+            return message
+        artifacts = None
+        sender = params.get("sender", None)
+        sender_name = params.get("sender_name", None)
+        stream_url = None
+        if (
+            text_type is AIMessage
+            or text_type is AIMessageChunk
+            or isinstance(text_output, (AIMessage, AIMessageChunk))
+        ):
             artifacts = ChatOutputResponse.from_message(
                 text_output,
                 sender=sender,
                 sender_name=sender_name,
             )
-        elif not isinstance(text_output, UnbuiltObject):
-            if isinstance(text_output, dict):
+        else:
+            files = self._normalized_files
+            if text_type is dict or isinstance(text_output, dict):
                 # Turn the dict into a pleasing to
                 # read JSON inside a code block
                 message = dict_to_codeblock(text_output)
-            elif isinstance(text_output, Data):
+            elif text_type is Data or isinstance(text_output, Data):
                 message = text_output.text
-            elif isinstance(message, (AsyncIterator, Iterator)):
+            elif hasattr(message, "__anext__") or hasattr(message, "__next__"):
+                # if the message is a generator or iterator
+                # it means that it is a stream of messages
                 stream_url = self.build_stream_url()
                 message = ""
-                self.results["text"] = message
-                self.results["message"].text = message
-                self._built_object = self.results
-            elif not isinstance(text_output, str):
-                message = str(text_output)
-            # if the message is a generator or iterator
-            # it means that it is a stream of messages
-
-            else:
+                results["text"] = message
+                results["message"].text = message
+                self._built_object = results
+            elif text_type is str or isinstance(text_output, str):
                 message = text_output
+            else:
+                message = str(text_output)
 
             if hasattr(sender_name, "get_text"):
                 sender_name = sender_name.get_text()
 
             artifact_type = ArtifactType.STREAM if stream_url is not None else ArtifactType.OBJECT
-            artifacts = ChatOutputResponse(
+            self.artifacts = ChatOutputResponse.fast_dump(
                 message=message,
                 sender=sender,
                 sender_name=sender_name,
@@ -295,10 +374,13 @@ class InterfaceVertex(ComponentVertex):
             artifacts = [self._built_object.data]
         elif isinstance(self._built_object, list):
             artifacts = []
+            append = artifacts.append
             ignore_errors = self.params.get("ignore_errors", False)
             for value in self._built_object:
-                if isinstance(value, Data):
-                    artifacts.append(value.data)
+                # the elements are almost always exactly Data, so the
+                # identity check short-circuits the isinstance MRO walk
+                if type(value) is Data or isinstance(value, Data):
+                    append(value.data)
                 elif ignore_errors:
                     logger.error(f"Data expected, but got {value} of type {type(value)}")
                 else:
@@ -308,11 +390,12 @@ class InterfaceVertex(ComponentVertex):
 
     async def _run(self, *args, **kwargs):
         if self.is_interface_component:
-            if self.vertex_type in CHAT_COMPONENTS:
+            if self._is_chat_component:
                 message = self._process_chat_component()
-            elif self.vertex_type in RECORDS_COMPONENTS:
+            elif self._is_data_component:
                 message = self._process_data_component()
-            if isinstance(self._built_object, (AsyncIterator, Iterator)):
+            built_object = self._built_object
+            if hasattr(built_object, "__anext__") or hasattr(built_object, "__next__"):
                 if self.params.get("return_data", False):
                     self._built_object = Data(text=message, data=self.artifacts)
                 else:
@@ -324,34 +407,53 @@ class InterfaceVertex(ComponentVertex):
 
     async def stream(self):
         iterator = self.params.get(INPUT_FIELD_NAME, None)
-        if not isinstance(iterator, (AsyncIterator, Iterator)):
+        # probing for __anext__/__next__ checks what the AsyncIterator and
+        # Iterator subclass hooks look for, without the ABC machinery
+        is_async = hasattr(iterator, "__anext__")
+        if not (is_async or hasattr(iterator, "__next__")):
             raise ValueError("The message must be an iterator or an async iterator.")
-        is_async = isinstance(iterator, AsyncIterator)
-        complete_message = ""
+
+        def _resolve_unwrap(first):
+            # probe the first chunk once and bind a specialized unwrap, so
+            # the loop avoids two hasattr calls per chunk; chunk types are
+            # homogeneous within a single stream
+            value = first.content if hasattr(first, "content") else first
+            if hasattr(value, "text"):
+                return (lambda m: m.text) if value is first else (lambda m: m.content.text)
+            return (lambda m: m) if value is first else (lambda m: m.content)
+
+        # accumulate chunks in a list and join once at the end instead of
+        # repeated string concatenation, which can degrade to O(N^2)
+        parts: List[str] = []
+        append = parts.append
+        unwrap = None
         if is_async:
             async for message in iterator:
-                message = message.content if hasattr(message, "content") else message
-                message = message.text if hasattr(message, "text") else message
+                if unwrap is None:
+                    unwrap = _resolve_unwrap(message)
+                message = unwrap(message)
+                append(message)
                 yield message
-                complete_message += message
         else:
             for message in iterator:
-                message = message.content if hasattr(message, "content") else message
-                message = message.text if hasattr(message, "text") else message
+                if unwrap is None:
+                    unwrap = _resolve_unwrap(message)
+                message = unwrap(message)
+                append(message)
                 yield message
-                complete_message += message
+        complete_message = "".join(parts)
 
         if hasattr(self.params.get("sender_name"), "get_text"):
             sender_name = self.params.get("sender_name").get_text()
         else:
             sender_name = self.params.get("sender_name")
-        self.artifacts = ChatOutputResponse(
+        self.artifacts = ChatOutputResponse.fast_dump(
             message=complete_message,
             sender=self.params.get("sender", ""),
             sender_name=sender_name,
-            files=[{"path": file} if isinstance(file, str) else file for file in self.params.get("files", [])],
+            files=self._normalized_files,
             type=ArtifactType.OBJECT.value,
-        ).model_dump()
+        )
 
         message = Message(
             text=complete_message,
@@ -364,7 +466,9 @@ class InterfaceVertex(ComponentVertex):
         self.params[INPUT_FIELD_NAME] = complete_message
         if isinstance(self._built_object, dict):
             for key, value in self._built_object.items():
-                if hasattr(value, "text") and (isinstance(value.text, (AsyncIterator, Iterator)) or value.text == ""):
+                if hasattr(value, "text") and (
+                    hasattr(value.text, "__anext__") or hasattr(value.text, "__next__") or value.text == ""
+                ):
                     self._built_object[key] = message
         else:
             self._built_object = message
@@ -379,7 +483,7 @@ class InterfaceVertex(ComponentVertex):
         for edge in edges:
             origin_vertex = self.graph.get_vertex(edge.source_id)
             for key, value in origin_vertex.results.items():
-                if isinstance(value, (AsyncIterator, Iterator)):
+                if hasattr(value, "__anext__") or hasattr(value, "__next__"):
                     origin_vertex.results[key] = complete_message
 
         await log_vertex_build(
@@ -395,7 +499,13 @@ class InterfaceVertex(ComponentVertex):
         self._built = True
 
     async def consume_async_generator(self):
-        async for _ in self.stream():
+        # drain via the bound __anext__ instead of async for: one method
+        # resolution for the whole stream instead of one per chunk
+        anext_ = self.stream().__aiter__().__anext__
+        try:
+            while True:
+                await anext_()
+        except StopAsyncIteration:
             pass
 
     def _is_chat_input(self):
@@ -407,18 +517,111 @@ class StateVertex(Vertex):
         super().__init__(data, graph=graph, base_type="custom_components")
         self.steps = [self._build]
         self.is_state = True
+        self._successors_cache: Optional[tuple] = None
 
     @property
     def successors_ids(self) -> List[str]:
-        successors = self.graph.successor_map.get(self.id, [])
-        return successors + self.graph.activated_vertices
+        # the scheduler polls this property repeatedly while the graph is
+        # static; both the successor map and the activated vertices are
+        # replaced wholesale on mutation, so pin them in the cache entry
+        # and compare by identity
+        successor_map = self.graph.successor_map
+        activated_vertices = self.graph.activated_vertices
+        cache = self._successors_cache
+        if cache is not None and cache[0] is successor_map and cache[1] is activated_vertices:
+            return cache[2]
+        successors_ids = successor_map.get(self.id, []) + activated_vertices
+        self._successors_cache = (successor_map, activated_vertices, successors_ids)
+        return successors_ids
+
+    def invalidate_successors(self):
+        self._successors_cache = None
 
     def _built_object_repr(self):
         if self.artifacts and "repr" in self.artifacts:
             return self.artifacts["repr"] or super()._built_object_repr()
 
 
+def _normalize_files(files) -> List[Any]:
+    """Normalize a files param into a list of dicts with a path key."""
+    if not files:
+        return []
+    if all(type(file) is dict for file in files):
+        return files
+    return [{"path": file} if type(file) is str else file for file in files]
+
+
+_JSON_PRIMITIVES = frozenset({str, int, float, bool, type(None)})
+_NONE_TYPE = type(None)
+# strings containing quotes, backslashes or control characters need real
+# JSON escaping and are left to orjson
+_JSON_ESCAPE_RE = re.compile(r'["\\\x00-\x1f]')
+
+
+def _emit_flat_json(d: dict) -> Optional[str]:
+    """Serialize a flat {str: primitive} dict as 2-space indented JSON.
+
+    Returns None when the dict does not fit the fast shape, in which case
+    the caller should fall back to orjson.
+    """
+    if not d:
+        return "{}"
+    parts = []
+    append = parts.append
+    for key, value in d.items():
+        value_type = type(value)
+        if type(key) is not str or value_type not in _JSON_PRIMITIVES or _JSON_ESCAPE_RE.search(key):
+            return None
+        if value_type is str:
+            if _JSON_ESCAPE_RE.search(value):
+                return None
+            append(f'  "{key}": "{value}"')
+        elif value_type is bool:
+            append(f'  "{key}": {"true" if value else "false"}')
+        elif value_type is _NONE_TYPE:
+            append(f'  "{key}": null')
+        elif value_type is float:
+            literal = repr(value)
+            # non-finite floats and scientific notation are formatted
+            # differently by orjson; keep the fast path byte-identical
+            if not math.isfinite(value) or "e" in literal:
+                return None
+            append(f'  "{key}": {literal}')
+        else:
+            if not -(2**63) <= value < 2**64:
+                # orjson rejects ints outside the 64-bit range
+                return None
+            append(f'  "{key}": {value!r}')
+    return "{\n" + ",\n".join(parts) + "\n}"
+
+
+# the same built object is rendered for every requester, so field
+# serialization results are cached per value; only immutable leaf types
+# are cached, since a mutable value could change in place between renders
+# and serve a stale result, and pinning arbitrary objects would keep them
+# alive until the wholesale clear. The value is kept in the entry so a
+# recycled id() cannot alias a different object.
+_SERIALIZED_FIELDS_CACHE: Dict[int, tuple] = {}
+_SERIALIZED_FIELDS_CACHE_MAX_SIZE = 256
+
+
 def dict_to_codeblock(d: dict) -> str:
-    serialized = {key: serialize_field(val) for key, val in d.items()}
-    json_str = json.dumps(serialized, indent=4)
+    cache = _SERIALIZED_FIELDS_CACHE
+    serialized = {}
+    for key, val in d.items():
+        if type(val) not in _JSON_PRIMITIVES:
+            serialized[key] = serialize_field(val)
+            continue
+        cached = cache.get(id(val))
+        if cached is not None and cached[0] is val:
+            serialized[key] = cached[1]
+        else:
+            if len(cache) >= _SERIALIZED_FIELDS_CACHE_MAX_SIZE:
+                cache.clear()
+            value = serialize_field(val)
+            cache[id(val)] = (val, value)
+            serialized[key] = value
+    json_str = _emit_flat_json(serialized)
+    if json_str is None:
+        json_str = orjson.dumps(serialized, option=orjson.OPT_INDENT_2).decode()
     return f"```json\n{json_str}\n```"
@@ -78,6 +78,48 @@ class ChatOutputResponse(BaseModel):
         content = message.content
         return cls(message=content, sender=sender, sender_name=sender_name)  # type: ignore
 
+    @classmethod
+    def fast_dump(
+        cls,
+        message: Union[str, List[Union[str, Dict]]],
+        sender: Optional[str] = "Machine",
+        sender_name: Optional[str] = "AI",
+        session_id: Optional[str] = None,
+        stream_url: Optional[str] = None,
+        files: Optional[List] = None,
+        type: str = "",  # noqa: A002
+    ) -> Dict:
+        """Build the model_dump(exclude_none=True) dict without a model instance.
+
+        The inputs come from trusted vertex params, so full validation is
+        skipped; only the markdown newline normalization is replicated.
+        Non-empty files still need the files validator and go through the
+        model.
+        """
+        if files:
+            return cls(
+                message=message,
+                sender=sender,
+                sender_name=sender_name,
+                session_id=session_id,
+                stream_url=stream_url,
+                files=files,
+                type=type,
+            ).model_dump(exclude_none=True)
+        if sender == "Machine" and isinstance(message, str):
+            message = message.replace("\n\n", "\n").replace("\n", "\n\n")
+        dump: Dict = {"message": message, "files": []}
+        if sender is not None:
+            dump["sender"] = sender
+        if sender_name is not None:
+            dump["sender_name"] = sender_name
+        if session_id is not None:
+            dump["session_id"] = session_id
+        if stream_url is not None:
+            dump["stream_url"] = stream_url
+        dump["type"] = getattr(type, "value", type)
+        return dump
+
     @model_validator(mode="after")
     def validate_message(self):
         """Validate message."""
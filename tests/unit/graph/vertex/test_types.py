@@ -0,0 +1,37 @@
+import orjson
+import pytest
+
+from langflow.graph.vertex.types import _emit_flat_json
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {},
+        {"text": "hello"},
+        {"text": "hello", "count": 3, "score": 1.5, "valid": True, "extra": None},
+        {"big": 2**62, "negative": -1, "fraction": -1.25},
+        {"unicode": "héllo wörld"},
+    ],
+)
+def test_emit_flat_json_matches_orjson(value):
+    assert _emit_flat_json(value) == orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"nested": {"a": 1}},
+        {"items": [1, 2, 3]},
+        {"quoted": 'a "quoted" string'},
+        {"escaped": "back\\slash"},
+        {"control": "line\nbreak"},
+        {"nan": float("nan")},
+        {"infinity": float("inf")},
+        {"exponent": 1e20},
+        {"huge": 10**20},
+        {1: "non-string key"},
+    ],
+)
+def test_emit_flat_json_falls_back_on_unsupported_shapes(value):
+    assert _emit_flat_json(value) is None
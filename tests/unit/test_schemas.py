@@ -0,0 +1,27 @@
+import pytest
+
+from langflow.utils.schemas import ChatOutputResponse
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"message": "hello", "sender": "Machine", "sender_name": "AI", "type": "object"},
+        {"message": "line one\nline two", "sender": "Machine", "sender_name": "AI", "type": "object"},
+        {"message": "already\n\nspaced", "sender": "Machine", "sender_name": "AI", "type": "object"},
+        {"message": "hello", "sender": "User", "sender_name": "User", "type": "object"},
+        {"message": "hello", "sender": None, "sender_name": None, "type": "object"},
+        {"message": "", "sender": "Machine", "sender_name": "AI", "stream_url": "/stream/url", "type": "stream"},
+        {"message": "hello", "sender": "Machine", "sender_name": "AI", "session_id": "session", "type": "object"},
+        {"message": ["chunk one", "chunk two"], "sender": "User", "sender_name": "User", "type": "object"},
+        {
+            "message": "hello",
+            "sender": "Machine",
+            "sender_name": "AI",
+            "files": [{"path": "some/file.txt"}],
+            "type": "object",
+        },
+    ],
+)
+def test_fast_dump_matches_model_dump(kwargs):
+    assert ChatOutputResponse.fast_dump(**kwargs) == ChatOutputResponse(**kwargs).model_dump(exclude_none=True)